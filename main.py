@@ -1,17 +1,22 @@
 from salesRegressor import logger
+from salesRegressor.components.run_context import RunContext
 from salesRegressor.pipeline.DataIngest import DataIngestionTrainingPipeline
 from salesRegressor.pipeline.DataVal import DataValidationTrainingPipeline
 from salesRegressor.pipeline.DataTransform import DataTransformationTrainingPipeline
 from salesRegressor.pipeline.ModelTrainer import ModelTrainerTrainingPipeline
 from salesRegressor.pipeline.ModelEval import ModelEvaluationTrainingPipeline
+from salesRegressor.pipeline.ModelExplain import ModelExplanationTrainingPipeline
+from salesRegressor.pipeline.ModelRegister import ModelRegistryTrainingPipeline
 
 
+context = RunContext()
+
 STAGE_NAME = "Data Ingestion stage"
 
 try:
    logger.info(f">>>>>> {STAGE_NAME} started <<<<<<") 
    data_ingestion = DataIngestionTrainingPipeline()
-   data_ingestion.main()
+   data_ingestion.main(context)
    logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
         logger.exception(e)
@@ -22,7 +27,7 @@ STAGE_NAME = "Data Validation stage"
 try:
    logger.info(f">>>>>> {STAGE_NAME} started <<<<<<") 
    data_validation = DataValidationTrainingPipeline()
-   data_validation.main()
+   data_validation.main(context)
    logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
         logger.exception(e)
@@ -33,7 +38,7 @@ STAGE_NAME = "Data Transformation stage"
 try:
    logger.info(f">>>>>> {STAGE_NAME} started <<<<<<") 
    data_transformation = DataTransformationTrainingPipeline()
-   data_transformation.main()
+   data_transformation.main(context)
    logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
         logger.exception(e)
@@ -45,7 +50,7 @@ try:
    logger.info(f"*******************")
    logger.info(f">>>>>> {STAGE_NAME} started <<<<<<")
    model_trainer = ModelTrainerTrainingPipeline()
-   model_trainer.main()
+   model_trainer.main(context)
    logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
         logger.exception(e)
@@ -57,8 +62,34 @@ try:
    logger.info(f"*******************")
    logger.info(f">>>>>> {STAGE_NAME} started <<<<<<")
    model_evaluation = ModelEvaluationTrainingPipeline()
-   model_evaluation.main()
+   model_evaluation.main(context)
    logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
         logger.exception(e)
-        raise e
\ No newline at end of file
+        raise e
+
+STAGE_NAME = "Model Registry stage"
+
+try: 
+   logger.info(f"*******************")
+   logger.info(f">>>>>> {STAGE_NAME} started <<<<<<")
+   model_registry = ModelRegistryTrainingPipeline()
+   model_registry.main(context)
+   logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        logger.exception(e)
+        raise e
+
+STAGE_NAME = "Model Explanation stage"
+
+try: 
+   logger.info(f"*******************")
+   logger.info(f">>>>>> {STAGE_NAME} started <<<<<<")
+   model_explanation = ModelExplanationTrainingPipeline()
+   model_explanation.main(context)
+   logger.info(f">>>>>> {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        logger.exception(e)
+        raise e
+
+context.report()
@@ -0,0 +1,62 @@
+import time
+import numpy as np
+import pandas as pd
+from salesRegressor import logger
+from salesRegressor.components.model_backends import get_backend, get_cat_features, split_features_target
+from salesRegressor.components.model_eval import ModelEvaluation
+from salesRegressor.entity.config_entity import BackendComparisonConfig
+from salesRegressor.utils.common import save_json
+
+
+class BackendComparison:
+    def __init__(self, config: BackendComparisonConfig):
+        self.config = config
+
+    def _benchmark_backend(self, name, params, X_train, y_train, X_test, y_test, cat_features) -> dict:
+        backend = get_backend(name, params)
+
+        start = time.perf_counter()
+        model = backend.fit(X_train, y_train, X_test, y_test, cat_features)
+        train_seconds = time.perf_counter() - start
+
+        # Best of N so a cold cache on the first call does not dominate the throughput.
+        predict_seconds = float("inf")
+        for _ in range(max(1, self.config.predict_repeats)):
+            start = time.perf_counter()
+            y_pred_log = backend.predict(model, X_test)
+            predict_seconds = min(predict_seconds, time.perf_counter() - start)
+
+        rmspe = ModelEvaluation.rmspe_metric(np.expm1(y_test), np.expm1(y_pred_log))
+
+        result = {
+            "train_seconds": round(train_seconds, 3),
+            "predict_seconds": round(predict_seconds, 3),
+            "predict_rows_per_second": round(len(X_test) / predict_seconds, 1),
+            "RMSPE": float(rmspe)
+        }
+        logger.info(f"{name}: {result}")
+        return result
+
+    def compare(self) -> dict:
+
+        train_df = pd.read_csv(self.config.train_file, low_memory=False)
+        test_df = pd.read_csv(self.config.test_file, low_memory=False)
+
+        X_train, y_train = split_features_target(train_df)
+        X_test, y_test = split_features_target(test_df)
+        cat_features = get_cat_features(X_train)
+
+        logger.info(f"Comparing backends {list(self.config.backends)} on "
+                    f"train shape {X_train.shape}; test shape {X_test.shape}")
+
+        report = {
+            "train_rows": len(X_train),
+            "test_rows": len(X_test),
+            "backends": {}
+        }
+        for name, params in self.config.backends.items():
+            report["backends"][name] = self._benchmark_backend(
+                name, params, X_train, y_train, X_test, y_test, cat_features)
+
+        save_json(self.config.report_file, report)
+        return report
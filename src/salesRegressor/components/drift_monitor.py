@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+from typing import List
+from salesRegressor import logger
+from salesRegressor.components.model_backends import get_cat_features, split_features_target
+from salesRegressor.entity.config_entity import DriftMonitorConfig
+from salesRegressor.utils.common import save_json, load_bin
+
+
+EPS = 1e-6
+
+
+# KLL-style quantile sketch: each level is a compactor holding fewer than k items,
+# and an item at level h stands for 2**h observations. Sketches from different
+# workers or days are merged level by level.
+class KLLSketch:
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) >= self.k:
+                items = np.sort(items)
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                items = items[:len(items) - len(keep)]
+                promoted = items[np.random.randint(2)::2]
+
+                self.levels[h] = keep
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        for h, items in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def cdf(self, x) -> np.ndarray:
+        items, cum_weights = self._weighted_items()
+        if len(items) == 0:
+            return np.zeros(len(np.atleast_1d(x)))
+        idx = np.searchsorted(items, x, side="right")
+        cum = np.concatenate([[0.0], cum_weights])
+        return cum[idx] / cum_weights[-1]
+
+    def quantile(self, q) -> np.ndarray:
+        items, cum_weights = self._weighted_items()
+        idx = np.searchsorted(cum_weights / cum_weights[-1], q, side="left")
+        return items[np.minimum(idx, len(items) - 1)]
+
+    def items(self) -> np.ndarray:
+        return np.concatenate(self.levels)
+
+
+class CategoryCounter:
+    def __init__(self):
+        self.n = 0
+        self.counts = {}
+
+    def update(self, values):
+        counts = pd.Series(values).astype(str).value_counts()
+        for key, count in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+        self.n += int(counts.sum())
+
+    def merge(self, other: "CategoryCounter"):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.n += other.n
+
+    def frequencies(self, keys) -> np.ndarray:
+        return np.array([self.counts.get(key, 0) for key in keys], dtype=float) / max(self.n, 1)
+
+
+class DataProfile:
+    def __init__(self, numeric_columns: List[str], categorical_columns: List[str], sketch_size: int = 200):
+        self.numeric_columns = list(numeric_columns)
+        self.categorical_columns = list(categorical_columns)
+        self.sketches = {col: KLLSketch(sketch_size) for col in self.numeric_columns}
+        self.sketches.update({col: CategoryCounter() for col in self.categorical_columns})
+
+    @classmethod
+    def from_frame(cls, X: pd.DataFrame, sketch_size: int = 200) -> "DataProfile":
+        cat_features = get_cat_features(X)
+        numeric = [col for col in X.columns if col not in cat_features]
+        profile = cls(numeric, cat_features, sketch_size)
+        profile.update(X)
+        return profile
+
+    def empty_like(self) -> "DataProfile":
+        sketch_size = next((s.k for s in self.sketches.values() if isinstance(s, KLLSketch)), 200)
+        return DataProfile(self.numeric_columns, self.categorical_columns, sketch_size)
+
+    def update(self, df: pd.DataFrame):
+        for col, sketch in self.sketches.items():
+            if col in df.columns:
+                if isinstance(sketch, KLLSketch):
+                    sketch.update(pd.to_numeric(df[col], errors="coerce").astype(float).to_numpy())
+                else:
+                    sketch.update(df[col])
+
+    def merge(self, other: "DataProfile"):
+        for col, sketch in self.sketches.items():
+            if col in other.sketches:
+                sketch.merge(other.sketches[col])
+
+
+def population_stability_index(expected: np.ndarray, actual: np.ndarray) -> float:
+    expected = np.clip(expected, EPS, None)
+    actual = np.clip(actual, EPS, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+class DriftMonitor:
+    def __init__(self, config: DriftMonitorConfig):
+        self.config = config
+        self.reference = load_bin(self.config.profile_file)
+        self.current = self.reference.empty_like()
+
+    def update(self, batch: pd.DataFrame):
+        X, _ = split_features_target(batch)
+        self.current.update(X)
+
+    def merge(self, profile: DataProfile):
+        self.current.merge(profile)
+
+    def _numeric_scores(self, reference: KLLSketch, current: KLLSketch) -> dict:
+        edges = np.unique(reference.quantile(np.linspace(0, 1, self.config.n_bins + 1)[1:-1]))
+
+        expected = np.diff(np.concatenate([[0.0], reference.cdf(edges), [1.0]]))
+        actual = np.diff(np.concatenate([[0.0], current.cdf(edges), [1.0]]))
+
+        points = np.concatenate([reference.items(), current.items()])
+        ks = float(np.max(np.abs(reference.cdf(points) - current.cdf(points))))
+
+        return {"psi": population_stability_index(expected, actual), "ks": ks}
+
+    def _categorical_scores(self, reference: CategoryCounter, current: CategoryCounter) -> dict:
+        keys = sorted(set(reference.counts) | set(current.counts))
+        expected = reference.frequencies(keys)
+        actual = current.frequencies(keys)
+
+        # For categories "ks" is the largest absolute change in a single category share.
+        return {"psi": population_stability_index(expected, actual),
+                "ks": float(np.max(np.abs(expected - actual)))}
+
+    def report(self) -> dict:
+        features = {}
+        skipped = []
+        for col, reference in self.reference.sketches.items():
+            current = self.current.sketches[col]
+            if current.n == 0:
+                continue
+            if reference.n == 0:
+                # e.g. a numeric column that was all NaN in train.csv: nothing to compare against.
+                skipped.append(col)
+                continue
+
+            if isinstance(reference, KLLSketch):
+                scores = self._numeric_scores(reference, current)
+            else:
+                scores = self._categorical_scores(reference, current)
+
+            scores["n"] = current.n
+            scores["drift"] = bool(scores["psi"] > self.config.psi_threshold
+                                   or scores["ks"] > self.config.ks_threshold)
+            features[col] = scores
+
+        drifted = [col for col, scores in features.items() if scores["drift"]]
+        logger.info(f"Drift detected on {len(drifted)} of {len(features)} features: {drifted}")
+        if skipped:
+            logger.warning(f"No training profile to compare against for: {skipped}")
+
+        report = {"drifted_features": drifted, "skipped_features": skipped, "features": features}
+        save_json(self.config.report_file, report)
+        return report
@@ -0,0 +1,193 @@
+from pathlib import Path
+from typing import List, Tuple
+import pandas as pd
+import lightgbm as lgb
+from catboost import CatBoostRegressor, Pool
+from salesRegressor import logger
+
+
+TARGET_COLUMN = "Sales"
+DROP_COLUMNS = ["Sales", "Date"]
+CATEGORICAL_COLUMNS = ["StoreType", "Assortment", "PromoInterval"]
+
+
+def split_features_target(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+
+    X = df.drop(DROP_COLUMNS, axis=1, errors="ignore")
+    y = df[TARGET_COLUMN] if TARGET_COLUMN in df.columns else None
+    return X, y
+
+def get_cat_features(X: pd.DataFrame) -> List[str]:
+
+    return [col for col in X.columns if X[col].dtype == 'object' or pd.api.types.is_string_dtype(X[col].dtype)
+            or col in CATEGORICAL_COLUMNS]
+
+def prepare_cat_features(X: pd.DataFrame, cat_features: List[str]) -> pd.DataFrame:
+    # PromoInterval is a mix of month strings and the 0 used to fill NaNs, so
+    # categorical columns are normalised to str before they reach a backend.
+    # Integer columns (e.g. pre-encoded category codes) are used as they are,
+    # and the frame is only copied when something has to be converted.
+    to_convert = [col for col in cat_features if not pd.api.types.is_integer_dtype(X[col].dtype)]
+    if not to_convert:
+        return X
+    X = X.copy()
+    for col in to_convert:
+        X[col] = X[col].astype(str)
+    return X
+
+
+class TrainerBackend:
+    name = None
+    model_suffix = None
+    thread_param = None
+
+    def __init__(self, params: dict = None):
+        params = dict(params or {})
+        self.early_stopping_rounds = params.pop("early_stopping_rounds", None)
+        self.verbose = params.pop("verbose", 0)
+        self.params = params
+
+    def fit(self, X_train, y_train, X_valid, y_valid, cat_features):
+        # X_valid/y_valid may be None, in which case the model trains without early stopping.
+        raise NotImplementedError
+
+    def predict(self, model, X: pd.DataFrame):
+        raise NotImplementedError
+
+    def explain(self, model, X: pd.DataFrame, thread_count: int = -1):
+        # Returns an (n_rows, n_features + 1) array; the last column is the expected value.
+        raise NotImplementedError
+
+    def save(self, model, path: Path):
+        raise NotImplementedError
+
+    def load(self, path: Path):
+        raise NotImplementedError
+
+
+class CatBoostBackend(TrainerBackend):
+    name = "catboost"
+    model_suffix = ".cbm"
+    thread_param = "thread_count"
+
+    def fit(self, X_train, y_train, X_valid, y_valid, cat_features):
+
+        train_pool = Pool(data=prepare_cat_features(X_train, cat_features), label=y_train,
+                          cat_features=cat_features)
+
+        model = CatBoostRegressor(verbose=self.verbose, **self.params)
+
+        logger.info("Training CatBoost model...")
+        if X_valid is None:
+            model.fit(train_pool)
+        else:
+            valid_pool = Pool(data=prepare_cat_features(X_valid, cat_features), label=y_valid,
+                              cat_features=cat_features)
+            model.fit(train_pool, eval_set=valid_pool, early_stopping_rounds=self.early_stopping_rounds)
+        return model
+
+    @staticmethod
+    def _pool(model, X: pd.DataFrame) -> Pool:
+        # Categorical columns come from the trained model, not from the dtypes of
+        # the batch: a batch with only "0" StateHoliday rows parses as int64.
+        cat_features = [model.feature_names_[i] for i in model.get_cat_feature_indices()]
+        return Pool(data=prepare_cat_features(X, cat_features), cat_features=cat_features)
+
+    def predict(self, model, X: pd.DataFrame):
+        return model.predict(self._pool(model, X))
+
+    def explain(self, model, X: pd.DataFrame, thread_count: int = -1):
+        return model.get_feature_importance(self._pool(model, X), type="ShapValues",
+                                            thread_count=thread_count)
+
+    def save(self, model, path: Path):
+        model.save_model(str(path))
+
+    def load(self, path: Path):
+        model = CatBoostRegressor()
+        model.load_model(str(path))
+        return model
+
+
+class LightGBMBackend(TrainerBackend):
+    name = "lightgbm"
+    model_suffix = ".txt"
+    thread_param = "n_jobs"
+
+    @staticmethod
+    def _to_category(X: pd.DataFrame, cat_features: List[str]) -> pd.DataFrame:
+        # LightGBM stores the training categories in the model file and re-aligns
+        # any pandas 'category' column to them at predict time.
+        X = X.copy()
+        for col in cat_features:
+            X[col] = X[col].astype(str).astype("category")
+        return X
+
+    @staticmethod
+    def _is_encoded(X: pd.DataFrame, cat_features: List[str]) -> bool:
+        # Integer category codes (as built by SegmentTrainer) are consumed natively.
+        return all(pd.api.types.is_integer_dtype(X[col].dtype) for col in cat_features)
+
+    def fit(self, X_train, y_train, X_valid, y_valid, cat_features):
+
+        encoded = self._is_encoded(X_train, cat_features)
+        if not encoded:
+            X_train = self._to_category(X_train, cat_features)
+
+        callbacks = [lgb.log_evaluation(period=self.verbose or 0)]
+        eval_set = None
+        if X_valid is not None:
+            eval_set = [(X_valid if encoded else self._to_category(X_valid, cat_features), y_valid)]
+            if self.early_stopping_rounds:
+                callbacks.append(lgb.early_stopping(self.early_stopping_rounds, verbose=bool(self.verbose)))
+
+        model = lgb.LGBMRegressor(verbose=-1, **self.params)
+
+        logger.info("Training LightGBM model...")
+        model.fit(X_train, y_train, eval_set=eval_set,
+                  categorical_feature=cat_features, callbacks=callbacks)
+        return model.booster_
+
+    @staticmethod
+    def _model_cat_features(model) -> List[str]:
+        # A freshly trained booster keeps the indices under 'categorical_column',
+        # one loaded from file under 'categorical_feature'.
+        indices = model.params.get("categorical_feature", model.params.get("categorical_column")) or []
+        if isinstance(indices, str):
+            indices = [int(i) for i in indices.split(",") if i]
+        names = model.feature_name()
+        return [names[int(i)] for i in indices]
+
+    def _prepare(self, model, X: pd.DataFrame) -> pd.DataFrame:
+        # Models trained on pandas categories carry pandas_categorical; models
+        # trained on integer codes expect the codes as they are.
+        if model.pandas_categorical:
+            return self._to_category(X, self._model_cat_features(model))
+        return X
+
+    def predict(self, model, X: pd.DataFrame):
+        return model.predict(self._prepare(model, X), num_iteration=model.best_iteration or None)
+
+    def explain(self, model, X: pd.DataFrame, thread_count: int = -1):
+        X = self._prepare(model, X)
+        return model.predict(X, num_iteration=model.best_iteration or None, pred_contrib=True,
+                             num_threads=max(thread_count, 0))
+
+    def save(self, model, path: Path):
+        model.save_model(str(path))
+
+    def load(self, path: Path):
+        return lgb.Booster(model_file=str(path))
+
+
+BACKENDS = {
+    CatBoostBackend.name: CatBoostBackend,
+    LightGBMBackend.name: LightGBMBackend,
+}
+
+
+def get_backend(name: str, params: dict = None) -> TrainerBackend:
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown model backend: {name}. Expected one of {list(BACKENDS)}")
+    return BACKENDS[name](params)
@@ -1,14 +1,15 @@
 import json
 import numpy as np
 import pandas as pd
-from catboost import CatBoostRegressor
 from sklearn.metrics import mean_squared_error
+from salesRegressor.components.model_backends import get_backend, split_features_target
 from salesRegressor.entity.config_entity import ModelEvaluationConfig
 
 
 class ModelEvaluation:
     def __init__(self, config: ModelEvaluationConfig):
         self.config = config
+        self.backend = get_backend(self.config.backend)
 
     @staticmethod
     def rmspe_metric(y_true, y_pred):
@@ -18,16 +19,15 @@ class ModelEvaluation:
         mask = y_true != 0
         return np.sqrt(np.mean(((y_true[mask] - y_pred[mask]) / y_true[mask]) ** 2))
 
-    def evaluate(self):
-        model = CatBoostRegressor()
-        model.load_model(self.config.model_path)
+    def evaluate(self, df_test: pd.DataFrame = None):
+        model = self.backend.load(self.config.model_path)
 
-        df_test = pd.read_csv(self.config.test_data_path, low_memory=False)
+        if df_test is None:
+            df_test = pd.read_csv(self.config.test_data_path, low_memory=False)
 
-        X_test = df_test.drop(['Sales', 'Date'], axis=1)
-        y_test = df_test['Sales']
+        X_test, y_test = split_features_target(df_test)
 
-        y_pred_log = model.predict(X_test)
+        y_pred_log = self.backend.predict(model, X_test)
         y_pred = np.expm1(y_pred_log)
 
         rmse = np.sqrt(mean_squared_error(np.expm1(y_test), y_pred))
@@ -39,4 +39,4 @@ class ModelEvaluation:
         }
 
         with open(self.config.metrics_file, "w") as f:
-            json.dump(metrics, f, indent=4)
\ No newline at end of file
+            json.dump(metrics, f, indent=4)
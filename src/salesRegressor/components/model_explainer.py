@@ -0,0 +1,127 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from salesRegressor import logger
+from salesRegressor.components.model_backends import get_backend, split_features_target
+from salesRegressor.entity.config_entity import ModelExplanationConfig
+from salesRegressor.utils.common import get_file_hash, save_bin, load_bin, save_json
+
+
+STORE_COLUMN = "Store"
+
+
+class ModelExplainer:
+    def __init__(self, config: ModelExplanationConfig):
+        self.config = config
+        self.backend = get_backend(self.config.backend)
+        self._explanations = None
+        os.makedirs(self.config.cache_dir, exist_ok=True)
+
+    def _file_hash(self, path) -> str:
+        # Content hashes are memoised by (path, size, mtime), so a repeated load
+        # only stats the files instead of re-reading them.
+        stat = os.stat(path)
+        fingerprint = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+        hashes_file = os.path.join(self.config.cache_dir, "file_hashes.json")
+        hashes = {}
+        if os.path.exists(hashes_file):
+            with open(hashes_file) as f:
+                hashes = json.load(f)
+
+        if fingerprint not in hashes:
+            hashes[fingerprint] = get_file_hash(path)
+            save_json(hashes_file, hashes)
+        return hashes[fingerprint]
+
+    def _cache_key(self) -> str:
+        model_hash = self._file_hash(self.config.model_path)
+
+        # The sampling settings are part of the data key: a different sample of the
+        # same file is a different set of explanations.
+        data_hash = hashlib.sha256(
+            f"{self._file_hash(self.config.data_path)}|{self.config.sample_size}|"
+            f"{self.config.stratify_column}|{self.config.random_state}".encode()
+        ).hexdigest()
+
+        return f"{self.backend.name}_{model_hash[:16]}_{data_hash[:16]}"
+
+    def _stratified_sample(self, df: pd.DataFrame) -> pd.DataFrame:
+        if len(df) <= self.config.sample_size:
+            return df
+
+        frac = self.config.sample_size / len(df)
+        sample = df.groupby(self.config.stratify_column, group_keys=False).sample(
+            frac=frac, random_state=self.config.random_state)
+
+        logger.info(f"Stratified sample on {self.config.stratify_column}: {len(sample)} of {len(df)} rows")
+        return sample.reset_index(drop=True)
+
+    def _compute_shap_values(self, model, X: pd.DataFrame) -> np.ndarray:
+        chunks = [X.iloc[start:start + self.config.chunk_size]
+                  for start in range(0, len(X), self.config.chunk_size)]
+
+        # Each worker thread gets its share of the cores so the native SHAP code
+        # does not oversubscribe the machine.
+        n_workers = max(1, min(self.config.n_workers, len(chunks)))
+        thread_count = max(1, (os.cpu_count() or 1) // n_workers)
+
+        logger.info(f"Computing SHAP values for {len(X)} rows in {len(chunks)} chunks "
+                    f"on {n_workers} workers")
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = executor.map(lambda chunk: self.backend.explain(model, chunk, thread_count), chunks)
+            return np.vstack(list(results))
+
+    def _summarise(self, shap_df: pd.DataFrame) -> dict:
+        abs_shap = shap_df.abs()
+
+        global_summary = abs_shap.mean().sort_values(ascending=False)
+        store_summary = abs_shap.groupby(level=STORE_COLUMN).mean()
+
+        return {
+            "global": global_summary,
+            "per_store": store_summary
+        }
+
+    def explain(self, df: pd.DataFrame = None) -> dict:
+        # df is the frame already in memory for data_path; the file on disk is
+        # still what the cache key is hashed from.
+
+        cache_file = os.path.join(self.config.cache_dir, f"{self._cache_key()}.joblib")
+        if os.path.exists(cache_file):
+            logger.info(f"Loading cached explanations from: {cache_file}")
+            self._explanations = load_bin(cache_file)
+            return self._explanations
+
+        model = self.backend.load(self.config.model_path)
+
+        if df is None:
+            df = pd.read_csv(self.config.data_path, low_memory=False)
+        df = self._stratified_sample(df)
+        X, _ = split_features_target(df)
+
+        shap_values = self._compute_shap_values(model, X)
+        # Store ids go on the index: Store is itself a feature with its own SHAP column.
+        shap_df = pd.DataFrame(shap_values[:, :-1], columns=list(X.columns),
+                               index=pd.Index(df[STORE_COLUMN].values, name=STORE_COLUMN))
+
+        explanations = {
+            "expected_value": float(shap_values[0, -1]),
+            "shap_values": shap_df,
+            **self._summarise(shap_df)
+        }
+
+        save_bin(explanations, cache_file)
+        self._explanations = explanations
+        return explanations
+
+    def global_summary(self) -> pd.Series:
+        explanations = self._explanations or self.explain()
+        return explanations["global"]
+
+    def store_summary(self, store: int) -> pd.Series:
+        explanations = self._explanations or self.explain()
+        return explanations["per_store"].loc[store].sort_values(ascending=False)
@@ -0,0 +1,137 @@
+import os
+import copy
+import json
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from salesRegressor import logger
+from salesRegressor.components.model_backends import get_backend
+from salesRegressor.entity.config_entity import ModelRegistryConfig
+from salesRegressor.utils.common import get_file_hash, save_json, load_json
+
+
+class ModelRegistry:
+    def __init__(self, config: ModelRegistryConfig):
+        self.config = config
+        os.makedirs(self.config.root_dir, exist_ok=True)
+
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._index = None
+        self._index_mtime = None
+        self._index_lock = threading.RLock()
+
+    def _read_index(self) -> dict:
+        # The parsed index is kept in memory and only re-read when registry.json
+        # changes on disk, so a load() costs one stat rather than a parse.
+        try:
+            mtime = os.stat(self.config.index_file).st_mtime_ns
+        except FileNotFoundError:
+            return {"versions": {}, "aliases": {}}
+
+        with self._index_lock:
+            if self._index is None or mtime != self._index_mtime:
+                with open(self.config.index_file) as f:
+                    self._index = json.load(f)
+                self._index_mtime = mtime
+            return self._index
+
+    def _write_index(self, index: dict):
+        # save_json swaps a temp file into place, so readers never see a partial index.
+        save_json(self.config.index_file, index)
+
+    def register(self, model_file, backend: str, params: dict = None,
+                 metrics_file=None, alias: str = None) -> str:
+
+        version = get_file_hash(model_file)[:self.config.hash_length]
+        with self._index_lock:
+            return self._register(version, model_file, backend, params, metrics_file, alias)
+
+    def _register(self, version, model_file, backend, params, metrics_file, alias) -> str:
+        index = copy.deepcopy(self._read_index())
+
+        if version in index["versions"]:
+            logger.info(f"Model {model_file} already registered as version {version}")
+        else:
+            version_dir = os.path.join(self.config.root_dir, version)
+            os.makedirs(version_dir, exist_ok=True)
+
+            stored_file = os.path.join(version_dir, "model" + get_backend(backend).model_suffix)
+            shutil.copyfile(model_file, stored_file)
+
+            metrics = load_json(metrics_file).to_dict() if metrics_file and os.path.exists(metrics_file) else {}
+            metadata = {
+                "version": version,
+                "backend": backend,
+                "model_file": stored_file,
+                "registered_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "params": dict(params or {}),
+                "metrics": metrics
+            }
+            save_json(os.path.join(version_dir, "metadata.json"), metadata)
+
+            index["versions"][version] = metadata
+            logger.info(f"Registered {backend} model {model_file} as version {version}")
+
+        if alias:
+            index["aliases"][alias] = version
+            logger.info(f"Alias '{alias}' -> {version}")
+
+        self._write_index(index)
+        return version
+
+    def set_alias(self, alias: str, ref: str) -> str:
+        with self._index_lock:
+            index = copy.deepcopy(self._read_index())
+            version = self._resolve(ref, index)
+            index["aliases"][alias] = version
+            self._write_index(index)
+        logger.info(f"Alias '{alias}' -> {version}")
+        return version
+
+    def _resolve(self, ref: str, index: dict) -> str:
+        version = index["aliases"].get(ref, ref)
+        if version not in index["versions"]:
+            raise KeyError(f"No registered model for '{ref}'")
+        return version
+
+    def _metadata(self, ref: str) -> dict:
+        # Returns the cached entry itself; only for read-only use inside the registry.
+        index = self._read_index()
+        return index["versions"][self._resolve(ref, index)]
+
+    def get_metadata(self, ref: str) -> dict:
+        # Callers get copies, so mutating them can never leak into the cached index.
+        return copy.deepcopy(self._metadata(ref))
+
+    def list_versions(self) -> list:
+        return copy.deepcopy(list(self._read_index()["versions"].values()))
+
+    def load(self, ref: str):
+        # Versions are content hashes, so a cached model can never go stale; only
+        # the alias lookup goes through the (in-memory) index on every call.
+        metadata = self._metadata(ref)
+        version = metadata["version"]
+
+        with self._lock:
+            if version in self._models:
+                self._models.move_to_end(version)
+                return self._models[version]
+
+        backend = get_backend(metadata["backend"])
+        model = backend.load(metadata["model_file"])
+        logger.info(f"Loaded model version {version} from: {metadata['model_file']}")
+
+        with self._lock:
+            self._models[version] = (backend, model)
+            self._models.move_to_end(version)
+            while len(self._models) > self.config.cache_size:
+                evicted, _ = self._models.popitem(last=False)
+                logger.info(f"Evicted model version {evicted} from the in-memory cache")
+            return self._models[version]
+
+    def predict(self, ref: str, X):
+        backend, model = self.load(ref)
+        return backend.predict(model, X)
@@ -1,44 +1,36 @@
 import pandas as pd
-from catboost import CatBoostRegressor, Pool
 from salesRegressor import logger
+from salesRegressor.components.model_backends import get_backend, get_cat_features, split_features_target
+from salesRegressor.components.drift_monitor import DataProfile
 from salesRegressor.entity.config_entity import ModelTrainerConfig
+from salesRegressor.utils.common import save_bin
 
 
 class ModelTrainer:
     def __init__(self, config: ModelTrainerConfig):
         self.config = config
+        self.backend = get_backend(self.config.backend, self.config.params)
 
-    def train(self):
+    def train(self, train_df: pd.DataFrame = None, test_df: pd.DataFrame = None):
 
-        train_df = pd.read_csv(self.config.train_file, low_memory=False)
-        test_df = pd.read_csv(self.config.test_file, low_memory=False)
+        if train_df is None:
+            train_df = pd.read_csv(self.config.train_file, low_memory=False)
+        if test_df is None:
+            test_df = pd.read_csv(self.config.test_file, low_memory=False)
 
-        y_train = train_df['Sales']
-        X_train = train_df.drop(['Sales', 'Date'], axis=1)
+        X_train, y_train = split_features_target(train_df)
+        X_test, y_test = split_features_target(test_df)
 
-        y_test = test_df['Sales']
-        X_test = test_df.drop(['Sales', 'Date'], axis=1)
+        cat_features = get_cat_features(X_train)
 
-        cat_features = [col for col in X_train.columns if X_train[col].dtype == 'object' or "StoreType" in col 
-                        or "Assortment" in col]
+        logger.info(f"Backend: {self.backend.name}; Categorical features: {cat_features}")
 
-        logger.info(f"Categorical features: {cat_features}")
+        model = self.backend.fit(X_train, y_train, X_test, y_test, cat_features)
 
-        train_pool = Pool(data=X_train, label=y_train, cat_features=cat_features)
-        test_pool = Pool(data=X_test, label=y_test, cat_features=cat_features)
-
-        model = CatBoostRegressor(
-            iterations=self.config.iterations,
-            learning_rate=self.config.learning_rate,
-            depth=self.config.depth,
-            loss_function=self.config.loss_function,
-            verbose=self.config.verbose
-        )
-
-        logger.info("Training CatBoost model...")
-        model.fit(train_pool, eval_set=test_pool, early_stopping_rounds=self.config.early_stopping_rounds)
-
-        model.save_model(self.config.model_file)
+        self.backend.save(model, self.config.model_file)
         logger.info(f"Model saved to: {self.config.model_file}")
 
-        return model
\ No newline at end of file
+        profile = DataProfile.from_frame(X_train, sketch_size=self.config.sketch_size)
+        save_bin(profile, self.config.profile_file)
+
+        return model
@@ -0,0 +1,167 @@
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from salesRegressor import logger
+from salesRegressor.config.configuration import ConfigurationManager
+from salesRegressor.utils.common import save_json
+
+
+class RunContext:
+    def __init__(self, config: ConfigurationManager = None):
+        start = time.perf_counter()
+        self.config = config or ConfigurationManager()
+        self.config_seconds = time.perf_counter() - start
+
+        self.run_config = self.config.get_run_context_config()
+        self._config_uses = 0
+        self._blocked_seconds = 0.0
+        self._parse_seconds_per_row = None
+
+        # Frames are keyed by their artifact path, so a stage asks for the same
+        # file it would otherwise read from disk.
+        self._frames = {}
+        self._pending = {}
+        self._stats = defaultdict(lambda: {"rows": 0, "write_seconds": 0.0, "parse_seconds": None,
+                                           "parse_source": "not measured", "reads_avoided": 0})
+        self._executor = ThreadPoolExecutor(max_workers=1) if self.run_config.write_behind else None
+
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.normpath(str(path))
+
+    @staticmethod
+    def _to_numpy_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        # Nullable extension columns (e.g. the UInt32 ISO week) become the plain
+        # numpy dtypes a CSV round-trip would give, so backends see the same frame.
+        for col in df.columns:
+            dtype = df[col].dtype
+            if pd.api.types.is_extension_array_dtype(dtype) and pd.api.types.is_numeric_dtype(dtype):
+                target = "float64" if df[col].isna().any() else "int64"
+                df[col] = df[col].to_numpy(dtype=target, na_value=np.nan)
+        return df
+
+    def get_config_manager(self) -> ConfigurationManager:
+        self._config_uses += 1
+        return self.config
+
+    def _write(self, key: str, df: pd.DataFrame):
+        start = time.perf_counter()
+        df.to_csv(key, index=False)
+        self._stats[key]["write_seconds"] = time.perf_counter() - start
+        logger.info(f"Wrote {key} in {self._stats[key]['write_seconds']:.2f}s")
+
+    def _wait(self, key: str):
+        # Time spent waiting on a write-behind is back on the critical path.
+        start = time.perf_counter()
+        self._pending.pop(key).result()
+        self._blocked_seconds += time.perf_counter() - start
+
+    def _measure_parses(self):
+        # Only frames a stage actually took from memory saved a parse. This runs
+        # after the last stage, so it never competes with training.
+        for key, stats in self._stats.items():
+            if stats["reads_avoided"] and os.path.exists(key):
+                start = time.perf_counter()
+                pd.read_csv(key, low_memory=False)
+                stats["parse_seconds"] = time.perf_counter() - start
+                stats["parse_source"] = "measured"
+
+    def _estimate_parses(self):
+        # Without a re-read, scale the parse rate of the raw inputs to each frame.
+        for stats in self._stats.values():
+            if stats["reads_avoided"] and stats["parse_seconds"] is None:
+                stats["parse_seconds"] = self._parse_seconds_per_row * stats["rows"]
+                stats["parse_source"] = "estimated"
+
+    def record_parse(self, seconds: float, rows: int):
+        # Called by a stage that has to parse its CSV inputs anyway.
+        if rows:
+            self._parse_seconds_per_row = seconds / rows
+
+    def put(self, path, df: pd.DataFrame):
+        key = self._key(path)
+        self._stats[key]["rows"] = len(df)
+
+        if not self.run_config.in_memory:
+            self._write(key, df)
+            return
+
+        df = self._to_numpy_dtypes(df)
+        self._frames[key] = df
+        if self._executor is not None:
+            self._pending[key] = self._executor.submit(self._write, key, df)
+        else:
+            # Without write-behind the artifact is still written, on the critical path.
+            start = time.perf_counter()
+            self._write(key, df)
+            self._blocked_seconds += time.perf_counter() - start
+
+    def get(self, path) -> pd.DataFrame:
+        key = self._key(path)
+        if key in self._frames:
+            self._stats[key]["reads_avoided"] += 1
+            return self._frames[key]
+        return pd.read_csv(key, low_memory=False)
+
+    def materialize(self, path):
+        key = self._key(path)
+        if key in self._pending:
+            self._wait(key)
+        elif key in self._frames and not self._stats[key]["write_seconds"]:
+            start = time.perf_counter()
+            self._write(key, self._frames[key])
+            self._blocked_seconds += time.perf_counter() - start
+
+    def flush(self):
+        for key in list(self._pending):
+            self._wait(key)
+
+    def report(self) -> dict:
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self.run_config.measure_savings:
+            self._measure_parses()
+        if self._parse_seconds_per_row is not None:
+            self._estimate_parses()
+
+        artifacts = {key: dict(stats) for key, stats in self._stats.items()}
+        config_loads_avoided = max(0, self._config_uses - 1)
+        parses = [stats for stats in artifacts.values() if stats["reads_avoided"]]
+        parses_counted = [stats for stats in parses if stats["parse_seconds"] is not None]
+
+        saved_seconds = config_loads_avoided * self.config_seconds
+        saved_seconds += sum(stats["parse_seconds"] * stats["reads_avoided"] for stats in parses_counted)
+
+        # Background writes still compete for the GIL, so they are reported as
+        # moved off the critical path rather than saved.
+        moved_seconds = 0.0
+        if self.run_config.in_memory and self.run_config.write_behind:
+            write_seconds = sum(stats["write_seconds"] for stats in artifacts.values())
+            moved_seconds = max(0.0, write_seconds - self._blocked_seconds)
+
+        report = {
+            "in_memory": self.run_config.in_memory,
+            "write_behind": self.run_config.write_behind,
+            "config_seconds": round(self.config_seconds, 3),
+            "config_loads_avoided": config_loads_avoided,
+            "blocked_on_writes_seconds": round(self._blocked_seconds, 3),
+            "moved_off_critical_path_seconds": round(moved_seconds, 3),
+            "artifacts": artifacts,
+            "estimated_seconds_saved": round(saved_seconds, 3)
+        }
+
+        reads_avoided = sum(stats["reads_avoided"] for stats in parses_counted)
+        unmeasured = sum(stats["reads_avoided"] for stats in parses) - reads_avoided
+        message = (f"In-memory stage handoff saved an estimated {saved_seconds:.2f}s "
+                   f"({reads_avoided} CSV parses avoided, {config_loads_avoided} config loads avoided); "
+                   f"{moved_seconds:.2f}s of CSV writes moved off the critical path")
+        if unmeasured:
+            message += f"; {unmeasured} avoided parses not measured and left out of the estimate"
+        logger.info(message)
+
+        save_json(self.run_config.report_file, report)
+        return report
@@ -0,0 +1,162 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from salesRegressor import logger
+from salesRegressor.components.model_backends import get_backend, get_cat_features, split_features_target
+from salesRegressor.entity.config_entity import SegmentTrainerConfig
+from salesRegressor.utils.common import save_json, load_json
+
+
+OTHER_SEGMENT = "__other__"
+
+
+def encode_categories(X: pd.DataFrame, categories: dict) -> pd.DataFrame:
+    # Segment models are trained on integer category codes; unseen values map to -1.
+    return X.assign(**{col: pd.Categorical(X[col].astype(str), categories=values).codes.astype(np.int32)
+                       for col, values in categories.items() if col in X.columns})
+
+
+class SegmentedModel:
+    def __init__(self, backend_name: str, segment_key: str, models: dict, categories: dict):
+        self.backend = get_backend(backend_name)
+        self.segment_key = segment_key
+        self.models = models
+        self.categories = categories
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        keys = X[self.segment_key].astype(str).to_numpy()
+        X = encode_categories(X, self.categories)
+        unknown = ~np.isin(keys, list(self.models))
+        if unknown.any():
+            if OTHER_SEGMENT not in self.models:
+                raise ValueError(f"No segment model for {self.segment_key} values: {sorted(set(keys[unknown]))}")
+            keys = np.where(unknown, OTHER_SEGMENT, keys)
+
+        # One predict call per segment over all of its rows, scattered back into input order.
+        y_pred = np.empty(len(X))
+        for key, idx in pd.DataFrame({"key": keys}).groupby("key").indices.items():
+            y_pred[idx] = self.backend.predict(self.models[key], X.iloc[idx])
+        return y_pred
+
+    def save(self, bundle_dir):
+        os.makedirs(bundle_dir, exist_ok=True)
+        files = {}
+        for key, model in self.models.items():
+            files[key] = os.path.join(bundle_dir, f"segment_{key}{self.backend.model_suffix}")
+            self.backend.save(model, files[key])
+
+        save_json(os.path.join(bundle_dir, "bundle.json"), {
+            "backend": self.backend.name,
+            "segment_key": self.segment_key,
+            "segments": files,
+            "categories": self.categories
+        })
+
+    @classmethod
+    def load(cls, bundle_dir) -> "SegmentedModel":
+        manifest = load_json(os.path.join(bundle_dir, "bundle.json"))
+        backend = get_backend(manifest.backend)
+        models = {key: backend.load(path) for key, path in manifest.segments.items()}
+        return cls(manifest.backend, manifest.segment_key, models, manifest.categories.to_dict())
+
+
+class SegmentTrainer:
+    def __init__(self, config: SegmentTrainerConfig):
+        self.config = config
+
+    def _segment_labels(self, keys: pd.Series) -> np.ndarray:
+        keys = keys.astype(str)
+        counts = keys.value_counts()
+        small = counts.index[counts < self.config.min_segment_rows]
+        if len(small):
+            logger.info(f"Pooling {len(small)} segments below {self.config.min_segment_rows} rows into {OTHER_SEGMENT}")
+        return np.where(keys.isin(small), OTHER_SEGMENT, keys).astype(str)
+
+    def _build_matrix(self, X: pd.DataFrame, cat_features: list, order: np.ndarray):
+        # Rows are written grouped by segment so every segment is a contiguous,
+        # zero-copy slice of the memory-mapped matrix. Categorical columns are
+        # stored as integer codes and handed to the backend as codes.
+        categories = {}
+
+        matrix = np.lib.format.open_memmap(self.config.matrix_file, mode="w+", dtype=np.float64,
+                                           shape=(len(X), X.shape[1]))
+        for j, col in enumerate(X.columns):
+            if col in cat_features:
+                codes, uniques = pd.factorize(X[col].astype(str))
+                categories[col] = [str(value) for value in uniques]
+                values = codes
+            else:
+                values = pd.to_numeric(X[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            matrix[:, j] = values[order]
+        matrix.flush()
+        del matrix
+
+        logger.info(f"Feature matrix {X.shape} memory-mapped at: {self.config.matrix_file}")
+        return np.load(self.config.matrix_file, mmap_mode="r"), categories
+
+    @staticmethod
+    def _to_frame(view: np.ndarray, columns: list, cat_features: list) -> pd.DataFrame:
+        # Numeric columns stay views of the memmap; only the few code columns
+        # are cast to int32, which both backends accept as categorical values.
+        df = pd.DataFrame(view, columns=columns, copy=False)
+        for col in cat_features:
+            df[col] = df[col].to_numpy().astype(np.int32)
+        return df
+
+    def train(self) -> SegmentedModel:
+
+        train_df = pd.read_csv(self.config.train_file, low_memory=False)
+        test_df = pd.read_csv(self.config.test_file, low_memory=False)
+
+        X_train, y_train = split_features_target(train_df)
+        X_test, y_test = split_features_target(test_df)
+        cat_features = get_cat_features(X_train)
+        columns = list(X_train.columns)
+
+        labels = self._segment_labels(X_train[self.config.segment_key])
+        order = np.argsort(labels, kind="stable")
+        sorted_labels = labels[order]
+        segment_keys, starts = np.unique(sorted_labels, return_index=True)
+        stops = np.append(starts[1:], len(sorted_labels))
+
+        matrix, categories = self._build_matrix(X_train, cat_features, order)
+        y_sorted = y_train.to_numpy()[order]
+
+        # From here on the memmap is the only copy of the training features.
+        del train_df, X_train, y_train, labels, sorted_labels, order
+
+        test_keys = X_test[self.config.segment_key].astype(str)
+        test_keys = np.where(test_keys.isin(segment_keys), test_keys, OTHER_SEGMENT)
+        X_test = encode_categories(X_test, categories)
+
+        cpu_budget = self.config.cpu_budget or os.cpu_count() or 1
+        n_jobs = max(1, min(self.config.n_jobs, len(segment_keys), cpu_budget))
+        params = {**self.config.params,
+                  get_backend(self.config.backend).thread_param: max(1, cpu_budget // n_jobs)}
+
+        def fit_segment(key, start, stop):
+            backend = get_backend(self.config.backend, params)
+            X_seg = self._to_frame(matrix[start:stop], columns, cat_features)
+            y_seg = y_sorted[start:stop]
+
+            valid_mask = test_keys == key
+            if valid_mask.any():
+                X_valid, y_valid = X_test[valid_mask], y_test[valid_mask]
+            else:
+                logger.warning(f"Segment {key} has no validation rows; training without early stopping")
+                X_valid, y_valid = None, None
+
+            logger.info(f"Training segment {self.config.segment_key}={key} on {stop - start} rows")
+            return str(key), backend.fit(X_seg, y_seg, X_valid, y_valid, cat_features)
+
+        logger.info(f"Training {len(segment_keys)} segment models on {n_jobs} workers "
+                    f"with a budget of {cpu_budget} CPUs")
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            models = dict(executor.map(fit_segment, segment_keys, starts, stops))
+
+        segmented_model = SegmentedModel(self.config.backend, self.config.segment_key, models, categories)
+        segmented_model.save(self.config.bundle_dir)
+        logger.info(f"Segment bundle saved to: {self.config.bundle_dir}")
+
+        return segmented_model
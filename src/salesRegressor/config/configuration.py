@@ -2,7 +2,10 @@ from salesRegressor.constants import *
 from salesRegressor.utils.common import read_yaml, create_directories
 from salesRegressor.entity.config_entity import (DataIngestionConfig, DataValidationConfig,
                                                  DataTransformationConfig, ModelTrainerConfig,
-                                                 ModelEvaluationConfig)
+                                                 ModelEvaluationConfig, BackendComparisonConfig,
+                                                 ModelExplanationConfig, ModelRegistryConfig,
+                                                 DriftMonitorConfig, SegmentTrainerConfig,
+                                                 RunContextConfig)
 
 
 class ConfigurationManager:
@@ -15,6 +18,12 @@ class ConfigurationManager:
         self.params = read_yaml(params_filepath)
 
         create_directories([self.config.artifacts_root])
+
+    def _get_backend_params(self, backend: str) -> dict:
+
+        if backend not in BACKEND_PARAMS:
+            raise ValueError(f"Unknown model backend: {backend}. Expected one of {list(BACKEND_PARAMS)}")
+        return self.params[BACKEND_PARAMS[backend]].to_dict()
     
     def get_data_ingestion_config(self) -> DataIngestionConfig:
         
@@ -62,7 +71,7 @@ class ConfigurationManager:
     
     def get_model_trainer_config(self) -> ModelTrainerConfig:
         config = self.config.model_trainer
-        params = self.params.CatBoostParams
+        backend = self.params.ModelTrainer.backend
 
         create_directories([config.root_dir])
 
@@ -70,27 +79,146 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             train_file=config.train_file,
             test_file=config.test_file,
-            model_file=config.model_file,
-            iterations=params.iterations,
-            learning_rate=params.learning_rate,
-            depth=params.depth,
-            loss_function=params.loss_function,
-            early_stopping_rounds=params.early_stopping_rounds,
-            verbose=params.verbose
+            model_file=config.model_file[backend],
+            backend=backend,
+            params=self._get_backend_params(backend),
+            profile_file=config.profile_file,
+            sketch_size=self.params.DriftMonitor.sketch_size
             )
         
         return model_trainer_config
     
     def get_model_evaluation_config(self) -> ModelEvaluationConfig:
         config = self.config.model_evaluation
+        backend = self.params.ModelTrainer.backend
         
         create_directories([config.root_dir])
         
         model_evaluation_config = ModelEvaluationConfig(
             root_dir=config.root_dir,
-            model_path=config.model_path,
+            model_path=config.model_path[backend],
             test_data_path=config.test_data_path,
-            metrics_file=config.metrics_file
+            metrics_file=config.metrics_file,
+            backend=backend
+            )
+
+        return model_evaluation_config
+    
+    def get_backend_comparison_config(self) -> BackendComparisonConfig:
+        config = self.config.backend_comparison
+        params = self.params.ModelTrainer
+
+        create_directories([config.root_dir])
+
+        backend_comparison_config = BackendComparisonConfig(
+            root_dir=config.root_dir,
+            train_file=config.train_file,
+            test_file=config.test_file,
+            report_file=config.report_file,
+            backends={name: self._get_backend_params(name) for name in params.compare_backends},
+            predict_repeats=params.predict_repeats
+            )
+
+        return backend_comparison_config
+    
+    def get_model_explanation_config(self) -> ModelExplanationConfig:
+        config = self.config.model_explanation
+        params = self.params.ModelExplanation
+        backend = self.params.ModelTrainer.backend
+
+        create_directories([config.root_dir, config.cache_dir])
+
+        model_explanation_config = ModelExplanationConfig(
+            root_dir=config.root_dir,
+            model_path=config.model_path[backend],
+            data_path=config.data_path,
+            cache_dir=config.cache_dir,
+            summary_file=config.summary_file,
+            backend=backend,
+            sample_size=params.sample_size,
+            stratify_column=params.stratify_column,
+            chunk_size=params.chunk_size,
+            n_workers=params.n_workers,
+            random_state=params.random_state
+            )
+
+        return model_explanation_config
+    
+    def get_model_registry_config(self) -> ModelRegistryConfig:
+        config = self.config.model_registry
+        params = self.params.ModelRegistry
+        backend = self.params.ModelTrainer.backend
+
+        create_directories([config.root_dir])
+
+        model_registry_config = ModelRegistryConfig(
+            root_dir=config.root_dir,
+            index_file=config.index_file,
+            model_file=config.model_file[backend],
+            metrics_file=config.metrics_file,
+            backend=backend,
+            params=self._get_backend_params(backend),
+            alias=params.alias,
+            cache_size=params.cache_size,
+            hash_length=params.hash_length
+            )
+
+        return model_registry_config
+    
+    def get_drift_monitor_config(self) -> DriftMonitorConfig:
+        config = self.config.drift_monitor
+        params = self.params.DriftMonitor
+
+        create_directories([config.root_dir])
+
+        drift_monitor_config = DriftMonitorConfig(
+            root_dir=config.root_dir,
+            profile_file=config.profile_file,
+            data_path=config.data_path,
+            report_file=config.report_file,
+            chunk_size=params.chunk_size,
+            n_bins=params.n_bins,
+            psi_threshold=params.psi_threshold,
+            ks_threshold=params.ks_threshold
+            )
+
+        return drift_monitor_config
+    
+    def get_segment_trainer_config(self) -> SegmentTrainerConfig:
+        config = self.config.segment_trainer
+        params = self.params.SegmentTrainer
+        backend = self.params.ModelTrainer.backend
+
+        create_directories([config.root_dir, config.bundle_dir])
+
+        segment_trainer_config = SegmentTrainerConfig(
+            root_dir=config.root_dir,
+            train_file=config.train_file,
+            test_file=config.test_file,
+            matrix_file=config.matrix_file,
+            bundle_dir=config.bundle_dir,
+            backend=backend,
+            params=self._get_backend_params(backend),
+            segment_key=params.segment_key,
+            min_segment_rows=params.min_segment_rows,
+            n_jobs=params.n_jobs,
+            cpu_budget=params.cpu_budget
+            )
+
+        return segment_trainer_config
+    
+    def get_run_context_config(self) -> RunContextConfig:
+        config = self.config.run_context
+        params = self.params.RunContext
+
+        create_directories([config.root_dir])
+
+        run_context_config = RunContextConfig(
+            root_dir=config.root_dir,
+            report_file=config.report_file,
+            in_memory=params.in_memory,
+            write_behind=params.write_behind,
+            measure_savings=params.measure_savings
             )
 
-        return model_evaluation_config
\ No newline at end of file
+        return run_context_config
\ No newline at end of file
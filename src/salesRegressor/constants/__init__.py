@@ -1,4 +1,9 @@
 from pathlib import Path
 
 CONFIG_FILE_PATH = Path("config\\config.yaml")
-PARAMS_FILE_PATH = Path("params.yaml")
\ No newline at end of file
+PARAMS_FILE_PATH = Path("params.yaml")
+
+BACKEND_PARAMS = {
+    "catboost": "CatBoostParams",
+    "lightgbm": "LightGBMParams",
+}
\ No newline at end of file
@@ -31,16 +31,83 @@ class ModelTrainerConfig:
     train_file: Path
     test_file: Path
     model_file: Path
-    iterations: int
-    learning_rate: float
-    depth: int
-    loss_function: str
-    early_stopping_rounds: int
-    verbose: int
+    backend: str
+    params: dict
+    profile_file: Path
+    sketch_size: int
 
 @dataclass(frozen=True)
 class ModelEvaluationConfig:
     root_dir: Path
     model_path: Path
     test_data_path: Path
-    metrics_file: Path
\ No newline at end of file
+    metrics_file: Path
+    backend: str
+
+@dataclass(frozen=True)
+class BackendComparisonConfig:
+    root_dir: Path
+    train_file: Path
+    test_file: Path
+    report_file: Path
+    backends: dict
+    predict_repeats: int
+
+@dataclass(frozen=True)
+class ModelExplanationConfig:
+    root_dir: Path
+    model_path: Path
+    data_path: Path
+    cache_dir: Path
+    summary_file: Path
+    backend: str
+    sample_size: int
+    stratify_column: str
+    chunk_size: int
+    n_workers: int
+    random_state: int
+
+@dataclass(frozen=True)
+class ModelRegistryConfig:
+    root_dir: Path
+    index_file: Path
+    model_file: Path
+    metrics_file: Path
+    backend: str
+    params: dict
+    alias: str
+    cache_size: int
+    hash_length: int
+
+@dataclass(frozen=True)
+class DriftMonitorConfig:
+    root_dir: Path
+    profile_file: Path
+    data_path: Path
+    report_file: Path
+    chunk_size: int
+    n_bins: int
+    psi_threshold: float
+    ks_threshold: float
+
+@dataclass(frozen=True)
+class SegmentTrainerConfig:
+    root_dir: Path
+    train_file: Path
+    test_file: Path
+    matrix_file: Path
+    bundle_dir: Path
+    backend: str
+    params: dict
+    segment_key: str
+    min_segment_rows: int
+    n_jobs: int
+    cpu_budget: int
+
+@dataclass(frozen=True)
+class RunContextConfig:
+    root_dir: Path
+    report_file: Path
+    in_memory: bool
+    write_behind: bool
+    measure_savings: bool
\ No newline at end of file
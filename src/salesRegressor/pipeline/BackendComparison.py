@@ -0,0 +1,27 @@
+from salesRegressor.config.configuration import ConfigurationManager
+from salesRegressor.components.backend_comparison import BackendComparison
+from salesRegressor import logger
+
+
+STAGE_NAME = "Backend Comparison stage"
+
+class BackendComparisonPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        config = ConfigurationManager()
+        backend_comparison_config = config.get_backend_comparison_config()
+        backend_comparison = BackendComparison(config=backend_comparison_config)
+        backend_comparison.compare()
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        obj = BackendComparisonPipeline()
+        obj.main()
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
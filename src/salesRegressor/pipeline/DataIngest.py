@@ -1,5 +1,6 @@
 from salesRegressor.config.configuration import ConfigurationManager
 from salesRegressor.components.data_ingest import DataIngestion
+from salesRegressor.components.run_context import RunContext
 from salesRegressor import logger
 
 
@@ -9,8 +10,8 @@ class DataIngestionTrainingPipeline:
     def __init__(self):
         pass
 
-    def main(self):
-        config = ConfigurationManager()
+    def main(self, context: RunContext = None):
+        config = context.get_config_manager() if context else ConfigurationManager()
         data_ingestion_config = config.get_data_ingestion_config()
         data_ingestion = DataIngestion(config=data_ingestion_config)
         data_ingestion.download_file()
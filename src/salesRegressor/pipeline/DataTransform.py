@@ -1,5 +1,7 @@
+import time
 from salesRegressor.config.configuration import ConfigurationManager
 from salesRegressor.components.data_transform import DataTransformation
+from salesRegressor.components.run_context import RunContext
 from salesRegressor import logger
 
 
@@ -7,13 +9,16 @@ class DataTransformationTrainingPipeline:
     def __init__(self):
         pass
 
-    def main(self):
+    def main(self, context: RunContext = None):
         
-        config = ConfigurationManager()
+        config = context.get_config_manager() if context else ConfigurationManager()
         data_transformation_config = config.get_data_transformation_config()
         data_transformation = DataTransformation(config=data_transformation_config)
 
+        start = time.perf_counter()
         sales_df, store_df = data_transformation._load_data()
+        if context:
+            context.record_parse(time.perf_counter() - start, len(sales_df) + len(store_df))
 
         sales_df = data_transformation._clean_sales(sales_df)
         store_df = data_transformation._clean_store(store_df)
@@ -27,11 +32,16 @@ class DataTransformationTrainingPipeline:
         merged_df = data_transformation._log_transform(
             merged_df, skewed_features=["Sales", "Customers", "CompetitionDistance"])
 
-        merged_df.to_csv(data_transformation_config.cleaned_data_file, index=False)
-        logger.info(f"Saving cleaned merged dataset")
-
         train_df, test_df = data_transformation._train_test_split(merged_df)
-        train_df.to_csv(data_transformation_config.train_file, index=False)
-        test_df.to_csv(data_transformation_config.test_file, index=False)
+
+        if context:
+            context.put(data_transformation_config.cleaned_data_file, merged_df)
+            context.put(data_transformation_config.train_file, train_df)
+            context.put(data_transformation_config.test_file, test_df)
+        else:
+            merged_df.to_csv(data_transformation_config.cleaned_data_file, index=False)
+            train_df.to_csv(data_transformation_config.train_file, index=False)
+            test_df.to_csv(data_transformation_config.test_file, index=False)
+        logger.info(f"Saving cleaned merged dataset")
 
         logger.info("Data transformation completed successfully.")
\ No newline at end of file
@@ -1,13 +1,14 @@
 from salesRegressor.config.configuration import ConfigurationManager
 from salesRegressor.components.data_val import DataValiadtion
+from salesRegressor.components.run_context import RunContext
 from salesRegressor import logger
 
 class DataValidationTrainingPipeline:
     def __init__(self):
         pass
 
-    def main(self):
-        config = ConfigurationManager()
+    def main(self, context: RunContext = None):
+        config = context.get_config_manager() if context else ConfigurationManager()
         data_validation_config = config.get_data_validation_config()
         data_validation = DataValiadtion(config=data_validation_config)
         data_validation.validate_all_files_exist()
\ No newline at end of file
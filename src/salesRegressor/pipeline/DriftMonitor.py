@@ -0,0 +1,33 @@
+import pandas as pd
+from salesRegressor.config.configuration import ConfigurationManager
+from salesRegressor.components.drift_monitor import DriftMonitor
+from salesRegressor import logger
+
+
+STAGE_NAME = "Drift Monitoring stage"
+
+class DriftMonitoringPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        config = ConfigurationManager()
+        drift_monitor_config = config.get_drift_monitor_config()
+        drift_monitor = DriftMonitor(config=drift_monitor_config)
+
+        for batch in pd.read_csv(drift_monitor_config.data_path, chunksize=drift_monitor_config.chunk_size,
+                                 low_memory=False):
+            drift_monitor.update(batch)
+
+        drift_monitor.report()
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        obj = DriftMonitoringPipeline()
+        obj.main()
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
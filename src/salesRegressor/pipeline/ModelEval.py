@@ -1,13 +1,15 @@
 from salesRegressor.config.configuration import ConfigurationManager
 from salesRegressor.components.model_eval import ModelEvaluation
+from salesRegressor.components.run_context import RunContext
 from salesRegressor import logger
 
 class ModelEvaluationTrainingPipeline:
     def __init__(self):
         pass
 
-    def main(self):
-        config = ConfigurationManager()
+    def main(self, context: RunContext = None):
+        config = context.get_config_manager() if context else ConfigurationManager()
         model_evaluation_config = config.get_model_evaluation_config()
         model_evaluator = ModelEvaluation(model_evaluation_config)
-        model_evaluator.evaluate()
\ No newline at end of file
+        df_test = context.get(model_evaluation_config.test_data_path) if context else None
+        model_evaluator.evaluate(df_test=df_test)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from salesRegressor.config.configuration import ConfigurationManager
+from salesRegressor.components.model_explainer import ModelExplainer
+from salesRegressor.components.run_context import RunContext
+from salesRegressor.utils.common import save_json
+from salesRegressor import logger
+
+class ModelExplanationTrainingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self, context: RunContext = None):
+        config = context.get_config_manager() if context else ConfigurationManager()
+        model_explanation_config = config.get_model_explanation_config()
+        model_explainer = ModelExplainer(model_explanation_config)
+        if context:
+            # The file on disk only feeds the cache key; the rows come from memory.
+            context.materialize(model_explanation_config.data_path)
+            model_explainer.explain(df=context.get(model_explanation_config.data_path))
+        global_summary = model_explainer.global_summary()
+        save_json(model_explanation_config.summary_file, global_summary.round(6).to_dict())
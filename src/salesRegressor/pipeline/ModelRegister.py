@@ -0,0 +1,20 @@
+from salesRegressor.config.configuration import ConfigurationManager
+from salesRegressor.components.model_registry import ModelRegistry
+from salesRegressor.components.run_context import RunContext
+from salesRegressor import logger
+
+class ModelRegistryTrainingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self, context: RunContext = None):
+        config = context.get_config_manager() if context else ConfigurationManager()
+        model_registry_config = config.get_model_registry_config()
+        model_registry = ModelRegistry(model_registry_config)
+        model_registry.register(
+            model_file=model_registry_config.model_file,
+            backend=model_registry_config.backend,
+            params=model_registry_config.params,
+            metrics_file=model_registry_config.metrics_file,
+            alias=model_registry_config.alias
+            )
@@ -1,13 +1,19 @@
 from salesRegressor.config.configuration import ConfigurationManager
 from salesRegressor.components.model_trainer import ModelTrainer
+from salesRegressor.components.run_context import RunContext
 from salesRegressor import logger
 
 class ModelTrainerTrainingPipeline:
     def __init__(self):
         pass
 
-    def main(self):
-        config = ConfigurationManager()
+    def main(self, context: RunContext = None):
+        config = context.get_config_manager() if context else ConfigurationManager()
         model_trainer_config = config.get_model_trainer_config()
-        model_trainer_config = ModelTrainer(config=model_trainer_config)
-        model_trainer_config.train()
\ No newline at end of file
+        model_trainer = ModelTrainer(config=model_trainer_config)
+        if context:
+            model_trainer.train(
+                train_df=context.get(model_trainer_config.train_file),
+                test_df=context.get(model_trainer_config.test_file))
+        else:
+            model_trainer.train()
\ No newline at end of file
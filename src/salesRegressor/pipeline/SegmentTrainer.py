@@ -0,0 +1,27 @@
+from salesRegressor.config.configuration import ConfigurationManager
+from salesRegressor.components.segment_trainer import SegmentTrainer
+from salesRegressor import logger
+
+
+STAGE_NAME = "Segment Trainer stage"
+
+class SegmentTrainerTrainingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        config = ConfigurationManager()
+        segment_trainer_config = config.get_segment_trainer_config()
+        segment_trainer = SegmentTrainer(config=segment_trainer_config)
+        segment_trainer.train()
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        obj = SegmentTrainerTrainingPipeline()
+        obj.main()
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -1,4 +1,6 @@
 import os
+import hashlib
+import tempfile
 from box.exceptions import BoxValueError
 import yaml
 from salesRegressor import logger
@@ -30,8 +32,14 @@ def create_directories(path_to_directories: list, verbose=True):
 
 def save_json(path: Path, data: dict):
 
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
 
     logger.info(f"json file saved at: {path}")
 
@@ -44,8 +52,15 @@ def load_json(path: Path) -> ConfigBox:
     return ConfigBox(content)
 
 def save_bin(data: Any, path: Path):
- 
-    joblib.dump(value=data, filename=path)
+    # Written to a temp file and swapped in, so a concurrent reader never sees a partial file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(value=data, filename=tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
     logger.info(f"binary file saved at: {path}")
 
 def load_bin(path: Path) -> Any:
@@ -57,4 +72,12 @@ def load_bin(path: Path) -> Any:
 def get_size(path: Path) -> str:
 
     size_in_kb = round(os.path.getsize(path)/1024)
-    return f"~ {size_in_kb} KB"
\ No newline at end of file
+    return f"~ {size_in_kb} KB"
+
+def get_file_hash(path: Path, chunk_size: int = 1 << 20) -> str:
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
\ No newline at end of file
@@ -0,0 +1,55 @@
+import types
+import numpy as np
+import pandas as pd
+from salesRegressor.components.drift_monitor import KLLSketch, DataProfile, DriftMonitor
+from salesRegressor.utils.common import save_bin
+
+
+def rank_error(sketch, values, qs):
+    values = np.sort(values)
+    ranks = np.searchsorted(values, sketch.quantile(qs), side="right") / len(values)
+    return np.max(np.abs(ranks - qs))
+
+
+def test_kll_quantiles_within_rank_error():
+    np.random.seed(0)
+    values = np.random.randn(200_000)
+
+    sketch = KLLSketch(k=200)
+    for chunk in np.array_split(values, 13):
+        sketch.update(chunk)
+
+    assert sketch.n == len(values)
+    assert sum(len(level) for level in sketch.levels) < 200 * 20
+    assert rank_error(sketch, values, np.linspace(0.01, 0.99, 99)) < 0.02
+
+
+def test_kll_merge_matches_union():
+    np.random.seed(1)
+    a_values = np.random.randn(100_000)
+    b_values = np.random.randn(50_000) + 1.0
+
+    a, b = KLLSketch(k=200), KLLSketch(k=200)
+    a.update(a_values)
+    b.update(b_values)
+    a.merge(b)
+
+    assert a.n == len(a_values) + len(b_values)
+    union = np.concatenate([a_values, b_values])
+    assert rank_error(a, union, np.linspace(0.01, 0.99, 99)) < 0.02
+
+
+def test_report_skips_features_without_reference(tmp_path):
+    train = pd.DataFrame({"x": np.random.rand(1000), "empty": np.nan, "StoreType": "a"})
+    save_bin(DataProfile.from_frame(train), tmp_path / "profile.joblib")
+
+    config = types.SimpleNamespace(profile_file=tmp_path / "profile.joblib",
+                                   report_file=tmp_path / "report.json",
+                                   n_bins=10, psi_threshold=0.2, ks_threshold=0.1)
+    monitor = DriftMonitor(config)
+    monitor.update(pd.DataFrame({"x": np.random.rand(500) + 2, "empty": np.random.rand(500),
+                                 "StoreType": "b"}))
+    report = monitor.report()
+
+    assert report["skipped_features"] == ["empty"]
+    assert set(report["drifted_features"]) == {"x", "StoreType"}